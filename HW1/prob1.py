@@ -9,7 +9,7 @@ if module_path not in sys.path:
     sys.path.append(module_path)
 
 try:
-    from etopotools import get_etopo, read_etopo
+    from etopotools import get_etopo, read_etopo, grid_area
 except ImportError as e:
     print(f"Error importing etopotools: {e}")
     print(f"Python path: {sys.path}")
@@ -20,28 +20,18 @@ except ImportError as e:
 filename = get_etopo(model='ice', resolution='60', quiet=True)
 height, lat, lon = read_etopo(filename, quiet=True)
 
-# Convert coordinates to radians
-phi = lat * np.pi / 180  # latitude in radians
-lam = lon * np.pi / 180  # longitude in radians
-
-# Create coordinate meshgrid
-phi_grid, lam_grid = np.meshgrid(phi, lam, indexing='ij')
-
-# Calculate grid spacing in radians
-dphi = np.abs(phi[1] - phi[0])
-dlam = np.abs(lam[1] - lam[0])
-
 # Earth's radius in meters
 a = 6371000  # meters
 
-# Calculate area element
-dA = a**2 * np.cos(phi_grid) * dphi * dlam
+# Calculate area element (depends only on latitude, shape (nlat,))
+dA_lat = grid_area(lat, lon, a)
 
 # Create ocean mask (True where there's ocean)
-ocean_mask = height < 0
+ocean_mask = np.less(height, 0)
 
-# Calculate total ocean area
-ocean_area = np.sum(dA * ocean_mask)
+# Calculate total ocean area: ocean cells per latitude band times the band's
+# cell area (avoids a full-size float64 dA*mask product)
+ocean_area = dA_lat @ np.count_nonzero(ocean_mask, axis=1)
 
 # Calculate total Earth surface area
 earth_area = 4 * np.pi * a**2
@@ -9,7 +9,7 @@ if module_path not in sys.path:
     sys.path.append(module_path)
 
 try:
-    from etopotools import get_etopo, read_etopo
+    from etopotools import get_etopo, read_etopo, grid_area
 except ImportError as e:
     print(f"Error importing etopotools: {e}")
     print(f"Python path: {sys.path}")
@@ -19,31 +19,16 @@ except ImportError as e:
 filename = get_etopo(model='ice', resolution='60', quiet=True)
 height, lat, lon = read_etopo(filename)
 
-# Convert coordinates to radians
-phi = lat * np.pi / 180  # latitude in radians
-lam = lon * np.pi / 180  # longitude in radians
-
-# Create coordinate meshgrid
-phi_grid, lam_grid = np.meshgrid(phi, lam, indexing='ij')
-
-# Calculate grid spacing in radians
-dphi = np.abs(phi[1] - phi[0])
-dlam = np.abs(lam[1] - lam[0])
-
-# Earth's mean radius in meters
-a = 6371000  # meters
-
-# Calculate area element (without vertical component)
-dA = a**2 * np.cos(phi_grid) * dphi * dlam  # units: m²
+# Calculate area element (without vertical component), shape (nlat,)
+dA_lat = grid_area(lat, lon)  # units: m²
 
 # Calculate ocean depth = - height (height is positive for land)
-depth = -np.where(height < 0, height, 0)  # m, 0 for land
-
-# Calculate volume element
-dV = dA * depth  # units: m³
+depth = -np.where(height < 0, height, 0).astype(np.float32, copy=False)  # m, 0 for land
 
-# Calculate total ocean volume
-V  = np.sum(dV)
+# Calculate total ocean volume, sum of dV = dA * depth: the depths of each
+# latitude band are summed in float32 (pairwise summation keeps the error far
+# below the printed precision), then weighted by the band's dA in float64
+V  = dA_lat @ depth.sum(axis=1)  # units: m³
 
 # Print results
 print(f"Total volume of the world's oceans: {V:.3e} m³")
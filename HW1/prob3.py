@@ -39,25 +39,33 @@ SA = gsw.SA_from_SP(salt_data, p, lon_grid, lat_grid)
 # Convert temperature to conservative temperature
 CT = gsw.CT_from_t(SA, temp_data, p)
 
-temp = np.nan_to_num(temp_data, nan = 0.0)
-salt = np.nan_to_num(SA, nan = 0.0)
+# create a wet dry mask wet = 1, dry = 0 (uint8 view of the boolean mask)
+wet = (~np.isnan(temp_data)).view(np.uint8)
+
+# Zero the NaNs in place; temp_data and SA are not used below
+temp = np.nan_to_num(temp_data, nan = 0.0, copy = False)
+salt = np.nan_to_num(SA, nan = 0.0, copy = False)
 
 # Create an area element array
 a = 6.371e6  # Earth's radius in meters
-dA = a**2 * np.cos(phi) * dphi * dlam 
-dA = dA[:, np.newaxis] 
+dA = a**2 * np.cos(phi) * dphi * dlam   # (nlat,), same for every longitude
 
-# create a wet dry mask wet = 1, dry = 0
-wet = (~np.isnan(temp_data)).astype(np.float64)
-h = np.trapezoid(wet, z, axis=2).squeeze()
+# Trapezoidal-rule weights on the (fixed) depth axis: each level gets half
+# of the layer above and half of the layer below it
+dz = np.diff(z)
+w = np.concatenate(([0.5*dz[0]], 0.5*(dz[:-1] + dz[1:]), [0.5*dz[-1]]))
 
-# First compute vertical integrals for each water column using trapezoidal rule
-T_col_int = np.trapezoid(temp, z, axis=2).squeeze() 
-S_col_int = np.trapezoid(salt, z, axis=2).squeeze()
+# Water column thickness
+h = np.einsum('ijkl,k->ijl', wet, w).squeeze()
 
+# First compute vertical integrals for each water column using trapezoidal rule
+T_col_int = np.einsum('ijkl,k->ijl', temp, w).squeeze()
+S_col_int = np.einsum('ijkl,k->ijl', salt, w).squeeze()
 
-T_avg = np.sum( T_col_int * dA ) / np.sum( h*dA )
-S_avg = np.sum( S_col_int * dA ) / np.sum( h*dA )
+# Area-weighted horizontal sums, contracted without forming the products
+volume = np.einsum('ij,i->', h, dA)
+T_avg = np.einsum('ij,i->', T_col_int, dA) / volume
+S_avg = np.einsum('ij,i->', S_col_int, dA) / volume
 
 print(f"Global volumetric average temperature: {T_avg:.2f} °C")
 print(f"Global volumetric average salinity: {S_avg:.2f} g/kg")
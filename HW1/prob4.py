@@ -3,6 +3,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
 from mpl_toolkits.axes_grid1.inset_locator import inset_axes
 import gsw
@@ -12,13 +13,17 @@ from woatools import get_woa, read_woa_csv
 lat_target = 45.0
 lon_target = -30.0  # negative = west
 
-# 2) Download the monthly climatology archives (1° resolution)
-temp_files = get_woa(v="t", t="decav", r="1.00", quiet=True)
-salt_files = get_woa(v="s", t="decav", r="1.00", quiet=True)
+# Temperature and salinity are independent, so download and read them side by side
+with ThreadPoolExecutor(max_workers=2) as pool:
+    # 2) Download the monthly climatology archives (1° resolution)
+    temp_job = pool.submit(get_woa, v="t", t="decav", r="1.00", quiet=True)
+    salt_job = pool.submit(get_woa, v="s", t="decav", r="1.00", quiet=True)
+    temp_files, salt_files = temp_job.result(), salt_job.result()
 
-# 3) Read all four seasons at once: time_code="13-16" → dims = (lat, lon, depth, 4)
-t_data, coords = read_woa_csv(temp_files, field_code="an", time_code="13-16", quiet=False)
-s_data, _      = read_woa_csv(salt_files, field_code="an", time_code="13-16", quiet=False)
+    # 3) Read all four seasons at once: time_code="13-16" → dims = (lat, lon, depth, 4)
+    temp_job = pool.submit(read_woa_csv, temp_files, field_code="an", time_code="13-16", quiet=False)
+    salt_job = pool.submit(read_woa_csv, salt_files, field_code="an", time_code="13-16", quiet=False)
+    (t_data, coords), (s_data, _) = temp_job.result(), salt_job.result()
 
 # coords contains 'lat', 'lon', 'depth', and a time axis for the 4 seasons
 lats   = coords["lat"]    # shape (nlat,)
@@ -26,10 +31,20 @@ lons   = coords["lon"]    # shape (nlon,)
 depths = coords["depth"]  # shape (ndepth,)
 
 # 4) Find nearest grid indices
+def nearest_index(values, target):
+    """Index of the element of the sorted array values closest to target"""
+    i = np.searchsorted(values, target)
+    if i == 0:
+        return 0
+    if i == len(values):
+        return len(values) - 1
+    # ties go to the lower index, as with argmin
+    return i if values[i] - target < target - values[i - 1] else i - 1
+
 #    Make longitude 0–360 if lons is that convention
 lon_mod = (lon_target + 360) % 360
-ilat = np.abs(lats - lat_target).argmin()
-ilon = np.abs(lons - lon_mod).argmin()
+ilat = nearest_index(lats, lat_target)
+ilon = nearest_index(lons, lon_mod)
 
 # 5) Extract 4 seasonal profiles:
 #    t_data[ilat, ilon, :, :] → shape (ndepth, 4)
@@ -37,13 +52,9 @@ ilon = np.abs(lons - lon_mod).argmin()
 temp_profiles = t_data[ilat, ilon, :, :].T   # shape (4, ndepth)
 salt_profiles = s_data[ilat, ilon, :, :].T   # shape (4, ndepth)
 
-# 6) Convert SP → SA for each season
-salt_absolute = []
-for sp in salt_profiles:
-    # sp: shape (ndepth,)
-    SA = gsw.SA_from_SP(sp, depths, lon_target, lat_target)
-    salt_absolute.append(SA)
-salt_absolute = np.array(salt_absolute)      # shape (4, ndepth)
+# 6) Convert SP → SA for all seasons at once (depths broadcast over seasons)
+salt_absolute = gsw.SA_from_SP(salt_profiles, depths[None, :],
+                               lon_target, lat_target)   # shape (4, ndepth)
 
 # 7) Plotting
 season_names = ["Winter", "Spring", "Summer", "Fall"]
@@ -3,6 +3,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 import gsw
 from woatools import get_woa, read_woa_csv
 
@@ -12,13 +13,17 @@ from woatools import get_woa, read_woa_csv
 # c) Total mass of salt in the ocean
 # d) Total mass of freshwater in the ocean
 
-# 1) Download decadal climatology ("decav") 1° data
-temp_files = get_woa(v="t", t="decav", r="1.00", quiet=True)
-salt_files = get_woa(v="s", t="decav", r="1.00", quiet=True)
+# Temperature and salinity are independent, so download and read them side by side
+with ThreadPoolExecutor(max_workers=2) as pool:
+    # 1) Download decadal climatology ("decav") 1° data
+    temp_job = pool.submit(get_woa, v="t", t="decav", r="1.00", quiet=True)
+    salt_job = pool.submit(get_woa, v="s", t="decav", r="1.00", quiet=True)
+    temp_files, salt_files = temp_job.result(), salt_job.result()
 
-# 2) Read objectively-analyzed fields at time_code="00" (climatology)
-t_data, coords = read_woa_csv(temp_files, field_code="an", time_code="00", quiet=True)
-s_data, _     = read_woa_csv(salt_files, field_code="an", time_code="00", quiet=True)
+    # 2) Read objectively-analyzed fields at time_code="00" (climatology)
+    temp_job = pool.submit(read_woa_csv, temp_files, field_code="an", time_code="00", quiet=True)
+    salt_job = pool.submit(read_woa_csv, salt_files, field_code="an", time_code="00", quiet=True)
+    (t_data, coords), (s_data, _) = temp_job.result(), salt_job.result()
 
 # 2b) Drop singleton time dimension if present
 if t_data.ndim == 4:
@@ -36,14 +41,13 @@ depths = coords['depth']   # shape (ndepth,)
 a = 6371000.0  # mean Earth radius (m)
 phi = lats * np.pi / 180  # latitude in radians
 lam = lons * np.pi / 180  # longitude in radians
-phi_grid, lam_grid = np.meshgrid(phi, lam, indexing='ij')
 
 # grid spacings
 dphi = np.abs(phi[1] - phi[0])
 dlam = np.abs(lam[1] - lam[0])
 
-# horizontal area
-dA = a**2 * np.cos(phi_grid) * dphi * dlam  # (nlat, nlon)
+# horizontal area (depends only on latitude)
+dA = a**2 * np.cos(phi) * dphi * dlam  # (nlat,)
 
 # 5) Compute vertical layer thickness dz
 #    approximate mid-layer thickness
@@ -51,39 +55,28 @@ dz = np.empty_like(depths)
 dz[:-1] = np.diff(depths)
 dz[-1] = dz[-2]
 
-# full 3D volume element dV = dA[...,None] * dz[None,None,...]
-dV = dA[:, :, None] * dz[None, None, :]
-
-# 6) Create mask for ocean cells
-wet = (~np.isnan(t_data)).astype(float)  # 1 over ocean, 0 over land
+# volume element dV = dA[:,None,None] * dz[None,None,:], broadcasts over longitude
+dV = dA[:, None, None] * dz[None, None, :]  # (nlat, 1, ndepth)
 
 # === Top 200m calculations ===
-mask200 = depths <= 200.0
-# restrict arrays to top 200m
-dV200 = dV[:, :, mask200]       # (nlat, nlon, n200)
-wet200 = wet[:, :, mask200]
-
-t200 = t_data[:, :, mask200]
-m200 = s_data[:, :, mask200]  # practical salinity (PSU)
+# depths increase down each column, so the top 200m is a leading slice of the
+# depth axis (views of the column data rather than boolean-indexed copies)
+n200 = np.searchsorted(depths, 200.0, side='right')
+dV200 = dV[:, :, :n200]       # (nlat, 1, n200)
 
-# Build 3D arrays for pressure, lat, lon over depths
-nlat, nlon, n200 = t200.shape
+t200 = t_data[:, :, :n200]
+m200 = s_data[:, :, :n200]  # practical salinity (PSU)
 
-# broadcast lat/lon grids
-lat2d = phi_grid  # in radians but gsw expects degrees
-lon2d = lam_grid
-
-# convert grids back to degrees for gsw
-lat2d_deg = lat2d*180/np.pi
-lon2d_deg = lon2d*180/np.pi
+# 6) Create mask for ocean cells
+wet200 = (~np.isnan(t200)).astype(float)  # 1 over ocean, 0 over land
 
-# make 3D
-lat3 = np.repeat(lat2d_deg[:, :, None], n200, axis=2)
-lon3 = np.repeat(lon2d_deg[:, :, None], n200, axis=2)
+# Broadcastable lat, lon and pressure for the gsw ufuncs (no 3D copies);
+# gsw expects degrees
+lat3 = lats[:, None, None]                 # (nlat, 1, 1)
+lon3 = lons[None, :, None]                 # (1, nlon, 1)
 
 # pressure ~ depth in dbar
-p3   = np.repeat(depths[mask200][None, None, :], nlat, axis=0)
-p3   = np.repeat(p3, nlon, axis=1)
+p3   = depths[None, None, :n200]           # (1, 1, n200)
 
 # convert SP -> SA, CT -> conservative temperature
 SA200 = gsw.SA_from_SP(m200, p3, lon3, lat3)
@@ -99,20 +92,20 @@ alpha_mean = np.nansum(alpha200 * vol_weight200) / np.nansum(vol_weight200)
 beta_mean  = np.nansum(beta200  * vol_weight200) / np.nansum(vol_weight200)
 
 # === Full-ocean salt & freshwater mass ===
-# build 3D for full depths
-lat3_full = np.repeat(lat2d_deg[:, :, None], depths.size, axis=2)
-lon3_full = np.repeat(lon2d_deg[:, :, None], depths.size, axis=2)
-p3_full   = np.repeat(depths[None, None, :], nlat, axis=0)
-p3_full   = np.repeat(p3_full, nlon, axis=1)
-SA_full  = gsw.SA_from_SP(s_data, p3_full, lon3_full, lat3_full)
+# lat3/lon3 broadcast over the full depth axis as well
+p3_full  = depths[None, None, :]           # (1, 1, ndepth)
+SA_full  = gsw.SA_from_SP(s_data, p3_full, lon3, lat3)
 CT_full  = gsw.CT_from_t(SA_full, t_data, p3_full)
 rho_full = gsw.rho(SA_full, CT_full, p3_full)
 
-# mass of salt = (SA/1000 [kg salt/kg sw]) * rho [kg/m3] * dV_full [m3]
-salt_mass = np.nansum((SA_full / 1000.0) * rho_full * dV)
+# seawater mass in each cell = rho [kg/m3] * dV_full [m3]
+cell_mass = rho_full * dV
+
+# mass of salt = (SA/1000 [kg salt/kg sw]) * rho * dV
+salt_mass = np.nansum(SA_full * cell_mass) / 1000.0
 
-# freshwater mass = (1 - SA/1000) * rho * dV
-fresh_mass = np.nansum((1.0 - SA_full / 1000.0) * rho_full * dV)
+# freshwater mass = (1 - SA/1000) * rho * dV = total mass - salt mass
+fresh_mass = np.nansum(cell_mass) - salt_mass
 
 # 7) Print results
 print(f"Volumetric mean thermal expansion (alpha) top 200m: {alpha_mean:.3e} 1/K")
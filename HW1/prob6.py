@@ -17,9 +17,6 @@ def v_theta(r):
 def r(x,y):
     return np.hypot(x, y)
 
-def theta(x,y):
-    return np.arctan2(y, x)
-
 def omega(r):
     """Angular frequency (rad/s)"""
     # avoid /0 at r=0
@@ -28,21 +25,21 @@ def omega(r):
     out[mask] = v_theta(r[mask]) / r[mask]
     return out
 
-def theta0(x, y, t):
-    return theta(x,y) - omega(r(x,y)) * t
-
-def X0(x, y, t):
-    return r(x,y) * np.cos(theta0(x,y,t))
-
-def Y0(x, y, t):
-    return r(x,y) * np.sin(theta0(x,y,t))
+def precompute(x, y, t):
+    """r, sin(-omega*t) and cos(-omega*t) on a grid, shared by T and its gradient"""
+    R = r(x,y)
+    ot = -omega(R) * t
+    return R, np.sin(ot), np.cos(ot)
 
-def T0(x, y):
-    return b + c*y
+def Y0(x, y, t, pre=None):
+    """Initial y of the parcel now at (x, y)"""
+    # r*sin(theta - omega*t) expanded, so no arctan2 or extra hypot is needed
+    _, sin_ot, cos_ot = precompute(x, y, t) if pre is None else pre
+    return x*sin_ot + y*cos_ot
 
-def T(x, y, t):
-    """Temperature advected by the vortex"""
-    return T0(X0(x,y,t), Y0(x,y,t))
+def T(x, y, t, pre=None):
+    """Temperature advected by the vortex, T0 = b + c*y0"""
+    return b + c*Y0(x, y, t, pre)
 
 
 # -----------------------
@@ -77,8 +74,9 @@ x2 = np.arange(-300, 301, dx)
 y2 = np.arange(-300, 301, dy)
 X2, Y2 = np.meshgrid(x2, y2)
 
-# temperature on the coarse grid
-T2 = T(X2, Y2, t1)
+# temperature on the coarse grid (r, sin, cos reused by the analytic gradient)
+pre2 = precompute(X2, Y2, t1)
+T2 = T(X2, Y2, t1, pre2)
 
 # --- 2a) centered finite differences on the interior ---
 Tx = (T2[1:-1, 2:] - T2[1:-1, :-2]) / (2*dx)
@@ -86,8 +84,7 @@ Ty = (T2[2:, 1:-1] - T2[:-2, 1:-1]) / (2*dy)
 mag_fd = np.sqrt(Tx**2 + Ty**2)
 
 # --- 2b) analytic gradient via chain rule ---
-R2 = r(X2, Y2)
-ω2 = omega(R2)
+R2, sin_ot, cos_ot = pre2
 
 # ∂ω/∂r
 ω_r = np.zeros_like(R2)
@@ -105,16 +102,13 @@ Ry[nonzero] =  Y2[nonzero] / R2[nonzero]
 ω_x = ω_r * Rx
 ω_y = ω_r * Ry
 
-sin_ot = np.sin(-ω2*t1)
-cos_ot = np.cos(-ω2*t1)
-common = X2*cos_ot - Y2*sin_ot
+common = t1 * (X2*cos_ot - Y2*sin_ot)
 
-y0_x = sin_ot - t1 * common * ω_x
-y0_y = cos_ot - t1 * common * ω_y
+y0_x = sin_ot - common * ω_x
+y0_y = cos_ot - common * ω_y
 
-Tx_an = c * y0_x
-Ty_an = c * y0_y
-mag_an = np.sqrt(Tx_an**2 + Ty_an**2)
+# |∇T| = |c| |∇y0| since T = b + c*y0
+mag_an = np.abs(c) * np.hypot(y0_x, y0_y)
 
 # -----------------------
 #  3) Plot comparison
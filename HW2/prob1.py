@@ -9,7 +9,7 @@ if module_path not in sys.path:
     sys.path.append(module_path)
 
 try:
-    from etopotools import get_etopo, read_etopo
+    from etopotools import get_etopo, read_etopo, grid_area
 except ImportError as e:
     print(f"Error importing etopotools: {e}")
     print(f"Python path: {sys.path}")
@@ -20,31 +20,30 @@ except ImportError as e:
 filename = get_etopo(model='ice', resolution='60', quiet=True)
 height, lat, lon = read_etopo(filename, quiet=True)
 
-# Convert coordinates to radians
-phi = lat * np.pi / 180  # latitude in radians
-lam = lon * np.pi / 180  # longitude in radians
-
-# Create coordinate meshgrid
-phi_grid, lam_grid = np.meshgrid(phi, lam, indexing='ij')
-
-# Calculate grid spacing in radians
-dphi = np.abs(phi[1] - phi[0])
-dlam = np.abs(lam[1] - lam[0])
-
-# Earth's radius in meters
-a = 6371000  # meters
-
-# Calculate area element
-dA = a**2 * np.cos(phi_grid) * dphi * dlam
+# Calculate area element (depends only on latitude, shape (nlat,))
+dA_lat = grid_area(lat, lon)
 
 # Calculate the horizontal area at each depth level
 dz = 50 # meters
 z = np.arange(-6000, 0, dz) # depth levels
-A = np.zeros(len(z)) # area at each depth level
 
 # Problem 1 (a):
-for i in range(len(z)):
-    A[i] = np.sum(dA[height < z[i]]) # area of grid cells below depth z[i]
+# Sort the grid cells by height once; the cumulative sum of their areas is
+# then the area of all cells below any given height
+order = np.argsort(height, axis=None)
+h_sorted = height.ravel()[order]
+dA_sorted = np.broadcast_to(dA_lat[:, None], height.shape).ravel()[order]
+# cumulative area written straight into a preallocated array with a leading 0
+# (no second full-size copy)
+cdf = np.empty(dA_sorted.size + 1)
+cdf[0] = 0.0
+np.cumsum(dA_sorted, out=cdf[1:])
+del dA_sorted, order
+
+# area of grid cells below depth z[i] (number of cells with height < z[i]);
+# z is cast to the height dtype so the sorted heights are not promoted to a
+# float64 copy (the 50 m levels are exact in float32 and int16)
+A = cdf[np.searchsorted(h_sorted, z.astype(h_sorted.dtype), side='left')]
 
 # Problem 1 (b):
 # Convert Sv to m³/s
@@ -66,8 +65,9 @@ Q[z_4000m:] = Q[z_4000m:] + 20 * Sv_to_m3s
 removal_rate = Q[z_500m] / (0 - z[z_500m])
 
 # Remove water linearly from 500m to surface
-for i in range(z_500m,len(z)):
-    Q[i] = Q[i-1] - removal_rate * dz
+# (closed form of Q[i] = Q[i-1] - removal_rate * dz for i >= z_500m)
+n = len(z) - z_500m
+Q[z_500m:] = Q[z_500m - 1] - removal_rate * dz * np.arange(1, n + 1)
 
 # Calculate vertical velocity w = Q/A
 w = Q / A  # m/s
@@ -1,3 +1,3 @@
-from .core import get_etopo, read_etopo, plot_etopo, get_citation
+from .core import get_etopo, read_etopo, grid_area, plot_etopo, get_citation
 
 __version__ = '0.1.0'
\ No newline at end of file
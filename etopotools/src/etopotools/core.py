@@ -1,4 +1,5 @@
 import os
+import functools
 import requests
 from tqdm.auto import tqdm
 import sys
@@ -7,6 +8,9 @@ import matplotlib.pyplot as plt
 import netCDF4 as nc
 from datetime import datetime
 
+# Streaming download chunk; small chunks are dominated by per-chunk overhead
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
 def get_citation():
     """
     Returns formatted citation for ETOPO data with current access date.
@@ -105,7 +109,6 @@ def get_etopo(model='ice', resolution='60', quiet=False):
     response.raise_for_status()
 
     total_size = int(response.headers.get('content-length', 0))
-    block_size = 8192
 
     if not quiet:
         if total_size > 0:
@@ -114,7 +117,7 @@ def get_etopo(model='ice', resolution='60', quiet=False):
         else:
             print(f"Downloading {filename}... (size unknown)")
     
-    with open(local_path, 'wb') as f, tqdm(
+    with open(local_path, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as f, tqdm(
             total=total_size if total_size > 0 else None,
             unit='iB',
             unit_scale=True,
@@ -123,7 +126,7 @@ def get_etopo(model='ice', resolution='60', quiet=False):
             dynamic_ncols=True,
             desc=filename
     ) as pbar:
-        for chunk in response.iter_content(block_size):
+        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
             if chunk:
                 size = f.write(chunk)
                 pbar.update(size)
@@ -141,7 +144,7 @@ def get_etopo(model='ice', resolution='60', quiet=False):
         return local_path
         
         
-def read_etopo(filename, quiet=False):
+def read_etopo(filename, quiet=False, cache=False):
     """
     Read ETOPO data from netCDF file.
     
@@ -149,18 +152,75 @@ def read_etopo(filename, quiet=False):
     ----------
     filename : str
         Path to netCDF file
+    quiet : bool
+        Unused, kept for symmetry with get_etopo
+    cache : bool
+        If True, keep the arrays of the most recently read file in memory
+        and return them again on the next call for the same file
         
     Returns
     -------
     tuple
-        (height, lat, lon) arrays
+        (height, lat, lon) arrays, in the dtypes stored in the file
+        (float32 heights for ETOPO 2022)
+
+    Notes
+    -----
+    By default every call reads the file and returns new, writable arrays.
+    With ``cache=True`` the arrays are shared between callers and therefore
+    read-only (use ``height.copy()`` to modify them); call
+    ``read_etopo.cache_clear()`` to release the cached grid.
     """
+    if cache:
+        return _read_etopo_cached(os.path.abspath(filename))
+    return _read_etopo_file(filename)
+
+def _read_etopo_file(filename):
     with nc.Dataset(filename) as ds:
-        height = ds.variables['z'][:].data
-        lat = ds.variables['lat'][:].data
-        lon = ds.variables['lon'][:].data
+        # Plain arrays in the file's dtype; masking would build a full-size
+        # mask array only to be discarded by .data
+        ds.set_auto_mask(False)
+        height = ds.variables['z'][:]
+        lat = ds.variables['lat'][:]
+        lon = ds.variables['lon'][:]
+    return height, lat, lon
+
+# A single entry: a 15-arc-second grid alone takes several GB
+@functools.lru_cache(maxsize=1)
+def _read_etopo_cached(filename):
+    height, lat, lon = _read_etopo_file(filename)
+    for arr in (height, lat, lon):
+        arr.flags.writeable = False
     return height, lat, lon
 
+read_etopo.cache_clear = _read_etopo_cached.cache_clear
+
+def grid_area(lat, lon, a=6371000.0):
+    """
+    Area of the grid cells of a regular latitude/longitude grid.
+    
+    Parameters
+    ----------
+    lat : ndarray
+        Latitude coordinates (degrees), uniformly spaced
+    lon : ndarray
+        Longitude coordinates (degrees), uniformly spaced
+    a : float
+        Earth's mean radius (m)
+        
+    Returns
+    -------
+    ndarray
+        dA = a^2 cos(phi) dphi dlam (m²) with shape (nlat,). The area only
+        depends on latitude, so broadcast it as ``dA[:, None]`` against
+        (nlat, nlon) fields instead of building a 2D grid.
+    """
+    phi = lat * np.pi / 180  # latitude in radians
+    lam = lon * np.pi / 180  # longitude in radians
+    dphi = np.abs(phi[1] - phi[0])
+    dlam = np.abs(lam[1] - lam[0])
+    return a**2 * np.cos(phi) * dphi * dlam
+
 def plot_etopo(height, lat, lon, title="Global Relief"):
     """
     Create a global relief map.
@@ -11,6 +11,10 @@ setup(
         'requests',
         'tqdm'
     ],
+    extras_require={
+        # Faster decompression; woatools falls back to the stdlib without them
+        'fast': ['isal', 'rapidgzip'],
+    },
     author="Francois Primeau",
     author_email="fprimeau@uci.edu",
     description="Tools for downloading and processing WOA23 data",
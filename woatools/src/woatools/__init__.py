@@ -1,3 +1,4 @@
 from .woa import get_woa, read_woa_csv, get_citation
-from .database import init_database, record_download, get_download_date
+from .database import (init_database, record_download, get_download_date,
+                       record_extracted_files, get_extracted_files)
 __version__ = "0.1.0"
\ No newline at end of file
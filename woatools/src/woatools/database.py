@@ -1,38 +1,76 @@
 import sqlite3
 import os
+import functools
+import threading
 from datetime import datetime
 
+# get_woa may run on several threads at once; they share one connection
+_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
+def _conn(db_path):
+    """Open (once per session) the tracking database at db_path"""
+    # Autocommit, so each statement is its own transaction unless BEGIN is used
+    conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('''CREATE TABLE IF NOT EXISTS downloads
+                    (filename TEXT PRIMARY KEY,
+                     variable TEXT,
+                     download_date TEXT)''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS extracted_files
+                    (filename TEXT,
+                     csv_path TEXT,
+                     PRIMARY KEY (filename, csv_path))''')
+    return conn
+
+def _connect(download_dir):
+    """Cached connection to downloads.db in download_dir"""
+    db_path = os.path.abspath(os.path.join(download_dir, 'downloads.db'))
+    if not os.path.exists(db_path):
+        # The database was removed (or never created): drop stale connections
+        _conn.cache_clear()
+    return _conn(db_path)
+
 def init_database(download_dir):
     """Initialize SQLite database for tracking WOA downloads"""
-    db_path = os.path.join(download_dir, 'downloads.db')
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    c.execute('''CREATE TABLE IF NOT EXISTS downloads
-                 (filename TEXT PRIMARY KEY, 
-                  variable TEXT,
-                  download_date TEXT)''')
-    conn.commit()
-    conn.close()
+    with _lock:
+        _connect(download_dir)
 
 def record_download(download_dir, filename, variable):
     """Record a new download in the database"""
-    db_path = os.path.join(download_dir, 'downloads.db')
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    c.execute('''INSERT OR REPLACE INTO downloads 
-                 VALUES (?, ?, ?)''',
-                 (filename, variable, datetime.now().strftime('%Y-%m-%d')))
-    conn.commit()
-    conn.close()
+    with _lock:
+        _connect(download_dir).execute('''INSERT OR REPLACE INTO downloads
+                                          VALUES (?, ?, ?)''',
+                                       (filename, variable, datetime.now().strftime('%Y-%m-%d')))
 
 def get_download_date(download_dir, variable):
     """Get the download date for a specific variable"""
-    db_path = os.path.join(download_dir, 'downloads.db')
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    c.execute('''SELECT download_date FROM downloads 
-                 WHERE variable = ? 
-                 ORDER BY download_date DESC LIMIT 1''', (variable,))
-    result = c.fetchone()
-    conn.close()
-    return result[0] if result else None
\ No newline at end of file
+    with _lock:
+        c = _connect(download_dir).execute('''SELECT download_date FROM downloads
+                                              WHERE variable = ?
+                                              ORDER BY download_date DESC LIMIT 1''', (variable,))
+        result = c.fetchone()
+    return result[0] if result else None
+
+def record_extracted_files(download_dir, filename, csv_files):
+    """Record the CSV files extracted from an archive, replacing any earlier list"""
+    with _lock:
+        conn = _connect(download_dir)
+        # One transaction for the whole list
+        with conn:
+            conn.execute('BEGIN')
+            conn.execute('''DELETE FROM extracted_files WHERE filename = ?''', (filename,))
+            # Paths are stored relative to download_dir
+            conn.executemany('''INSERT OR REPLACE INTO extracted_files
+                                VALUES (?, ?)''',
+                             [(filename, os.path.relpath(f, download_dir)) for f in csv_files])
+
+def get_extracted_files(download_dir, filename):
+    """Get the CSV files recorded for an archive (empty list if none)"""
+    with _lock:
+        c = _connect(download_dir).execute('''SELECT csv_path FROM extracted_files
+                                              WHERE filename = ?
+                                              ORDER BY rowid''', (filename,))
+        result = c.fetchall()
+    return [os.path.join(download_dir, row[0]) for row in result]
@@ -1,14 +1,72 @@
 import os
+import io
+import re
 import requests
 import tarfile
 import zipfile
-import gzip
+try:
+    # ISA-L's SIMD inflate, a drop-in replacement for the gzip module
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+try:
+    # Parallel (multi-core) inflate of a single gzip stream
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from tqdm.auto import tqdm  # For progress bar
 import numpy as np 
 import pandas as pd 
-from .database import init_database, record_download, get_download_date
+from .database import (init_database, record_download, get_download_date,
+                       record_extracted_files, get_extracted_files)
 from datetime import datetime
+from types import MappingProxyType
+
+# Streaming download chunk; small chunks are dominated by per-chunk overhead
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+# Copy buffer for decompressing CSVs (as CPython's gzip READ_BUFFER_SIZE)
+READ_BUFFER_SIZE = 128 * 1024  # 128 KiB
+
+# Map one-letter codes to variable names (read-only, module-level)
+VARIABLE_MAP = MappingProxyType({
+    "t": "temperature",
+    "s": "salinity",
+    "i": "silicate",
+    "n": "nitrate",
+    "p": "phosphate",
+    "o": "oxygen",
+    "O": "o2sat",
+    "A": "AOU"
+})
+
+# Map time span abbreviations to descriptive names
+TIME_SPAN_MAP = MappingProxyType({
+    "5564": "1955-1964",
+    "6574": "1965-1974",
+    "7584": "1975-1984",
+    "8594": "1985-1994",
+    "95A4": "1995-2004",
+    "A5B4": "2005-2014",
+    "B5C2": "2015-2022",
+    "decav71A0": "1971-2000",
+    "decav81B0": "1981-2010",
+    "decav91C0": "1991-2020",
+    "decav": "1955-2022",
+    "all": "all available data"  # all only works for the nutrients
+})
+
+# Map user-friendly resolutions to WOA-compatible resolutions
+RESOLUTION_MAP = MappingProxyType({
+    "1deg": "1.00",
+    "1.00": "1.00",
+    "0.25deg": "0.25",
+    "0.25": "0.25",
+    "5deg": "5.00",
+    "5.00": "5.00"
+})
 
 
 def get_citation(variable=None):
@@ -145,58 +203,20 @@ def get_woa(v, t, r, quiet = False):
           DOI: https://doi.org/10.25923/39qw-7j08
     -------------------------------------------------------------------------
     """
-  # Map one-letter codes to variable names
-    variable_map = {
-        "t": "temperature",
-        "s": "salinity",
-        "i": "silicate",
-        "n": "nitrate",
-        "p": "phosphate",
-        "o": "oxygen",
-        "O": "o2sat",
-        "A": "AOU"
-    }
-
-    # Map time span abbreviations to descriptive names
-    time_span_map = {
-        "5564": "1955-1964",
-        "6574": "1965-1974",
-        "7584": "1975-1984",
-        "8594": "1985-1994",
-        "95A4": "1995-2004",
-        "A5B4": "2005-2014",
-        "B5C2": "2015-2022",
-        "decav71A0": "1971-2000",
-        "decav81B0": "1981-2010",
-        "decav91C0": "1991-2020",
-        "decav": "1955-2022",
-        "all": "all available data"  # all only works for the nutrients
-    }
-
-    # Map user-friendly resolutions to WOA-compatible resolutions
-    resolution_map = {
-        "1deg": "1.00",
-        "1.00": "1.00",
-        "0.25deg": "0.25",
-        "0.25": "0.25",
-        "5deg": "5.00",
-        "5.00": "5.00"
-    }
-
     # Validate and map the input variable
-    if v not in variable_map:
-        raise ValueError(f"Invalid variable code '{v}'. Valid codes are: {', '.join(variable_map.keys())}")
-    v_full = variable_map[v]
+    if v not in VARIABLE_MAP:
+        raise ValueError(f"Invalid variable code '{v}'. Valid codes are: {', '.join(VARIABLE_MAP.keys())}")
+    v_full = VARIABLE_MAP[v]
 
     # Validate and map the time span
-    if t not in time_span_map:
-        raise ValueError(f"Invalid time span code '{t}'. Valid codes are: {', '.join(time_span_map.keys())}")
-    t_full = time_span_map[t]
+    if t not in TIME_SPAN_MAP:
+        raise ValueError(f"Invalid time span code '{t}'. Valid codes are: {', '.join(TIME_SPAN_MAP.keys())}")
+    t_full = TIME_SPAN_MAP[t]
 
     # Validate and map the resolution
-    if r not in resolution_map:
-        raise ValueError(f"Invalid resolution code '{r}'. Valid codes are: {', '.join(resolution_map.keys())}")
-    r_mapped = resolution_map[r]
+    if r not in RESOLUTION_MAP:
+        raise ValueError(f"Invalid resolution code '{r}'. Valid codes are: {', '.join(RESOLUTION_MAP.keys())}")
+    r_mapped = RESOLUTION_MAP[r]
 
     # Prepare URL components
     v_folder = v_full
@@ -211,54 +231,69 @@ def get_woa(v, t, r, quiet = False):
     if not quiet:
         print("Downloading from:", download_url)
 
-    # Initialize download tracking database
+    # Create download directory if it doesn't exist and initialize the
+    # download tracking database
     download_dir = "woa_downloads"
     os.makedirs(download_dir, exist_ok=True)
     init_database(download_dir)
-
-    # Create download directory if it doesn't exist
-    download_dir = "woa_downloads"
-    os.makedirs(download_dir, exist_ok=True)
     local_path = os.path.join(download_dir, file_name)
 
+    # Skip download and extraction if the CSVs from an earlier call are all there
+    cached_files = get_extracted_files(download_dir, file_name)
+    if cached_files and all(os.path.exists(f) for f in cached_files):
+        if not quiet:
+            print(f"CSV files from {local_path} already extracted. Skipping extraction.")
+        return cached_files
+
     # Check whether the archive file already exists
+    extracted_files = None
     if os.path.exists(local_path):
         if not quiet:
             print(f"File {local_path} already exists. Skipping download.")
     else:
-        # Download the archive with a progress bar
+        # Download the archive with a progress bar, to a temporary name so an
+        # interrupted download is not mistaken for a cached archive
+        part_path = local_path + ".part"
         with requests.get(download_url, stream=True) as response:
             response.raise_for_status()
             total_size = int(response.headers.get('content-length', 0))
-            block_size = 8192  # 8 KB blocks
             with tqdm(total=total_size, unit='B', unit_scale=True, desc=file_name,
                       bar_format='{l_bar}{bar} {percentage:3.0f}%') as progress_bar:
-                with open(local_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=block_size):
-                        if chunk:
-                            f.write(chunk)
-                            progress_bar.update(len(chunk))
+                with open(part_path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                    chunks = (chunk for chunk in
+                              response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE) if chunk)
+                    stream = _TeeReader(chunks, f, progress_bar)
+                    if file_name.endswith(".tar.gz"):
+                        # Extract while downloading, instead of re-reading the
+                        # archive from disk once it is saved
+                        if not quiet:
+                            print("Extracting tar.gz archive...")
+                        with gzip.open(stream, "rb") as gz:
+                            extracted_files = _extract_tar(gz, download_dir)
+                    # Save whatever the extraction did not need to read
+                    stream.read()
+        os.replace(part_path, local_path)
+        # Download successful, record it
+        record_download(download_dir, file_name, v)
         if not quiet:        
             print("Downloaded file saved to:", local_path)
 
-  # If download successful, record it
-    if not os.path.exists(local_path):
-        # ...existing download code...
-        record_download(download_dir, file_name, v)
-
    # Extract the archive and track extracted files
-    extracted_files = []
-    if file_name.endswith(".tar.gz"):
+    if extracted_files is not None:
+        # Already extracted from the download stream
+        if not quiet:
+            print("Extraction complete.")
+    elif file_name.endswith(".tar.gz"):
         if not quiet:
             print("Extracting tar.gz archive...")
-        with tarfile.open(local_path, "r:gz") as tar:
-            # Get list of all files in the archive
-            members = tar.getmembers()
-            # Extract all files
-            tar.extractall(path=download_dir)
-            # Store the paths of extracted files
-            extracted_files = [os.path.join(download_dir, member.name) 
-                             for member in members]
+        # Inflate the outer gzip stream on all cores when rapidgzip is available
+        # (parallelization=0 lets rapidgzip detect the core count)
+        if rapidgzip is not None:
+            archive = rapidgzip.open(local_path, parallelization=0)
+        else:
+            archive = gzip.open(local_path, "rb")
+        with archive as gz:
+            extracted_files = _extract_tar(gz, download_dir)
         if not quiet:
             print("Extraction complete.")
     elif file_name.endswith(".zip"):
@@ -279,20 +314,128 @@ def get_woa(v, t, r, quiet = False):
         return []
 
     # Decompress only the .csv.gz files that were just extracted
-    for gz_file in [f for f in extracted_files if f.endswith('.csv.gz')]:
-        csv_path = gz_file[:-3]  # Strip off the .gz extension
+    gz_files = [f for f in extracted_files if f.endswith('.csv.gz')]
+    # The files are independent and zlib releases the GIL while inflating,
+    # so decompress them on a thread pool
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        # Add the decompressed file paths to our list
+        extracted_files.extend(executor.map(_gunzip_one, gz_files,
+                                            [quiet] * len(gz_files)))
+
+    # Return only the paths of CSV files that were just extracted, and
+    # remember them so the next call can skip the extraction
+    csv_files = [f for f in extracted_files if f.endswith('.csv')]
+    record_extracted_files(download_dir, file_name, csv_files)
+    return csv_files
+
+class _TeeReader(io.RawIOBase):
+    """Read-only stream over downloaded chunks that also saves each chunk"""
+
+    def __init__(self, chunks, sink, progress_bar):
+        self._chunks = chunks
+        self._sink = sink
+        self._progress_bar = progress_bar
+        self._chunk = b""
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._pos == len(self._chunk):
+            self._chunk = next(self._chunks, b"")
+            self._pos = 0
+            if not self._chunk:
+                return 0
+            self._sink.write(self._chunk)
+            self._progress_bar.update(len(self._chunk))
+        n = min(len(buffer), len(self._chunk) - self._pos)
+        buffer[:n] = self._chunk[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+def _extract_tar(fileobj, download_dir):
+    """Extract an uncompressed tar stream and return the paths of its members"""
+    # Stream mode ("r|") reads the archive in one forward pass; seeking
+    # back would re-inflate the whole stream (and igzip cannot seek back)
+    extracted_files = []
+    with tarfile.open(fileobj=fileobj, mode="r|") as tar:
+        # Extract each member as it is read and store the path (a string, not
+        # the TarInfo) of each regular file
+        for member in tar:
+            target = os.path.join(download_dir, member.name)
+            # get_woa may extract two archives into download_dir at once, and
+            # tarfile creates missing parent directories without exist_ok
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            tar.extract(member, path=download_dir)
+            if member.isfile():
+                extracted_files.append(target)
+    return extracted_files
+
+def _gunzip_one(gz_file, quiet=False):
+    """Decompress a .csv.gz file next to itself, remove it and return the .csv path"""
+    csv_path = gz_file[:-3]  # Strip off the .gz extension
+    # A .csv only ever appears complete (it is renamed into place below), so
+    # a non-empty one left by an earlier run is kept as is
+    if os.path.exists(csv_path) and os.path.getsize(csv_path) > 0:
+        if not quiet:
+            print(f"File {csv_path} already exists. Skipping decompression.")
+    else:
         if not quiet:
             print(f"Decompressing {gz_file} to {csv_path}")
+        # Decompress to a temporary name so an interrupted run leaves no
+        # truncated .csv behind
+        part_path = csv_path + ".part"
         with gzip.open(gz_file, 'rb') as f_in:
-            with open(csv_path, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
-        os.remove(gz_file)
-        # Add the decompressed file path to our list
-        extracted_files.append(csv_path)
+            with open(part_path, 'wb', buffering=READ_BUFFER_SIZE) as f_out:
+                shutil.copyfileobj(f_in, f_out, length=READ_BUFFER_SIZE)
+        os.replace(part_path, csv_path)
+    os.unlink(gz_file)
+    return csv_path
 
-    # Return only the paths of CSV files that were just extracted
-    csv_files = [f for f in extracted_files if f.endswith('.csv')]
-    return csv_files
+def _read_csv_values(file, names):
+    """Parse a WOA CSV body into lat, lon and a (row, depth) float32 array"""
+    # Values are parsed straight to float32; lat/lon stay float64. The file
+    # is memory-mapped, so the C parser tokenizes the page cache directly
+    # index_col=False keeps column 0 as lat even when a row has more fields
+    # than names (e.g. a trailing comma)
+    kwargs = dict(skiprows=2, header=None, names=names, index_col=False,
+                  dtype={k: np.float32 for k in names[2:]},
+                  na_values=[''], engine='c', memory_map=True)
+    try:
+        # usecols drops the fields beyond the deepest level
+        df = pd.read_csv(file, usecols=names, **kwargs)
+    except pd.errors.ParserError:
+        # usecols fails when no row reaches the deepest level; such a file
+        # has no over-long rows either, so read it without usecols
+        df = pd.read_csv(file, **kwargs)
+    # Unparseable lat/lon become NaN, so the row is skipped below
+    lat = pd.to_numeric(df[0], errors='coerce').to_numpy(dtype=np.float64)
+    lon = pd.to_numeric(df[1], errors='coerce').to_numpy(dtype=np.float64)
+    # Skip rows without a valid lat/lon
+    valid = ~(np.isnan(lat) | np.isnan(lon))
+    return lat[valid], lon[valid], df.iloc[:, 2:].to_numpy()[valid]
+
+def _parse_in_order(files, names, max_workers):
+    """Parse files on a thread pool and yield the results in file order,
+    with at most max_workers files parsed ahead of the caller"""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for file in files:
+            pending.append(executor.submit(_read_csv_values, file, names))
+            if len(pending) == max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def _grid_index(grid, values):
+    """Indices of values in the sorted grid, or None if any value is off the grid"""
+    if len(grid) == 0:
+        return None
+    idx = np.searchsorted(grid, values)
+    if not np.array_equal(grid[np.minimum(idx, len(grid) - 1)], values):
+        return None
+    return idx
 
 def read_woa_csv(csv_files, field_code, time_code, quiet = False):
     """
@@ -326,13 +469,19 @@ def read_woa_csv(csv_files, field_code, time_code, quiet = False):
     Returns:
     --------
     data : numpy.ndarray
-        4D array with dimensions (latitude, longitude, depth, time)
+        4D float32 array with dimensions (latitude, longitude, depth, time)
     coords : dict
         Dictionary containing coordinate arrays:
         - 'lat': latitude values
         - 'lon': longitude values
         - 'depth': depth levels
         - 'time': time points
+
+    Notes:
+    ------
+    The files are parsed on a thread pool, at most min(number of files, CPU
+    count) of them ahead of the copy into `data`. Peak memory is therefore the
+    output array plus roughly that many parsed files.
     """
     # Validate time code
     if time_code == '00':
@@ -347,9 +496,11 @@ def read_woa_csv(csv_files, field_code, time_code, quiet = False):
     else:
         raise ValueError("time_code must be '00' (annual), '01-12' (monthly), or '13-16' (seasonal)")
 
-    # Filter files to match both field_code and time pattern
-    import re
-    filtered_files = [f for f in csv_files if re.search(pattern, f)]
+    # Filter files to match both field_code and time pattern (on the file
+    # name only, so the directory path cannot match)
+    time_pattern = re.compile(pattern)
+    filtered_files = [f for f in csv_files
+                      if time_pattern.search(os.path.basename(f))]
     if not filtered_files:
         raise ValueError(f"No files found matching field code '{field_code}' and time code '{time_code}'")
     
@@ -365,30 +516,12 @@ def read_woa_csv(csv_files, field_code, time_code, quiet = False):
         depth_line = f.readline().strip()
         # Extract depths from the comma-separated list after "DEPTHS (M):"
         depth_str = depth_line.split('DEPTHS (M):')[1]
-        depths = np.array([float(d) for d in depth_str.split(',')])
+        # (parsed in C; kept float64 like the lat/lon coordinates)
+        depths = np.fromstring(depth_str, sep=',', dtype=np.float64)
 
-    # Initialize lists to store coordinates
-    all_lats = set()
-    all_lons = set()
-    
-    # First pass: collect all unique lat/lon coordinates
-    for file in filtered_files:
-        with open(file, 'r') as f:
-            _ = f.readline()  # Skip header
-            _ = f.readline()  # Skip depth line
-            for line in f:
-                values = line.strip().split(',')
-                if len(values) >= 2:  # Ensure line has at least lat,lon
-                    try:
-                        lat, lon = float(values[0]), float(values[1])
-                        all_lats.add(lat)
-                        all_lons.add(lon)
-                    except ValueError:
-                        continue
-    
-    # Convert to sorted numpy arrays
-    lats = np.array(sorted(all_lats))
-    lons = np.array(sorted(all_lons))
+    # Column labels: lat, lon and one column per depth level; rows that
+    # stop at the sea floor are padded with NaN by the parser
+    names = range(2 + len(depths))
     
     # Determine temporal resolution from number of files
     if len(filtered_files) == 12:
@@ -403,36 +536,38 @@ def read_woa_csv(csv_files, field_code, time_code, quiet = False):
     else:
         raise ValueError(f"Unexpected number of CSV files: {len(filtered_files)}. Expected 1, 4, or 12.")
 
-    # Initialize output array with NaN values
-    data = np.full((len(lats), len(lons), len(depths), n_time), np.nan)
-    
-    # Create coordinate mappings for faster indexing
-    lat_idx = {lat: i for i, lat in enumerate(lats)}
-    lon_idx = {lon: i for i, lon in enumerate(lons)}
-    
-    # Second pass: fill the data array
-    for t, file in enumerate(filtered_files):
-        with open(file, 'r') as f:
-            _ = f.readline()  # Skip header
-            _ = f.readline()  # Skip depth line
-            for line in f:
-                values = line.strip().split(',')
-                if len(values) >= 3:  # Ensure line has data
-                    try:
-                        lat, lon = float(values[0]), float(values[1])
-                        data_values = values[2:]
-                        i = lat_idx[lat]
-                        j = lon_idx[lon]
-                        # Fill data for all available depths
-                        for k, val in enumerate(data_values):
-                            if val.strip():  # Check if value exists and is not empty
-                                try:
-                                    data[i, j, k, t] = float(val)
-                                except (ValueError, IndexError):
-                                    continue
-                    except (ValueError, KeyError):
-                        continue
-    
+    # Single pass: the first file fixes the lat/lon grid, and every file is
+    # written into the data array as soon as it is parsed. The files are
+    # independent, so they are parsed on a thread pool (the pandas C parser
+    # releases the GIL) and consumed here in time order
+    data = None
+    max_workers = min(len(filtered_files), os.cpu_count() or 1)
+    parsed = _parse_in_order(filtered_files, names, max_workers)
+    for t, (lat, lon, values) in enumerate(parsed):
+        if data is None:
+            # Sorted unique coordinates of the first file
+            lats = np.unique(lat)
+            lons = np.unique(lon)
+            # Initialize output array with NaN values (float32: the CSVs
+            # carry only a few significant digits)
+            data = np.full((len(lats), len(lons), len(depths), n_time), np.nan,
+                           dtype=np.float32)
+        i = _grid_index(lats, lat)
+        j = _grid_index(lons, lon)
+        if i is None or j is None:
+            # Points outside the grid seen so far (not expected for WOA23):
+            # grow the grid to the union and move the data already read
+            new_lats = np.union1d(lats, lat)
+            new_lons = np.union1d(lons, lon)
+            grown = np.full((len(new_lats), len(new_lons), len(depths), n_time), np.nan,
+                            dtype=np.float32)
+            grown[np.ix_(np.searchsorted(new_lats, lats),
+                         np.searchsorted(new_lons, lons))] = data
+            lats, lons, data = new_lats, new_lons, grown
+            i = np.searchsorted(lats, lat)
+            j = np.searchsorted(lons, lon)
+        data[i, j, :, t] = values
+
     # Create coordinate dictionary
     coords = {
         'lat': lats,
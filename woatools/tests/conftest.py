@@ -0,0 +1,9 @@
+import pytest
+
+from woatools import get_woa
+
+
+@pytest.fixture(scope="session")
+def csv_files():
+    """CSV files of the test archive, fetched once for all read tests"""
+    return get_woa(v="t", t="decav", r="1.00", quiet=True)
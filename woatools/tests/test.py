@@ -1,9 +1,6 @@
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from woatools import get_woa, read_woa_csv
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 def test_download():
     """Test downloading WOA data"""
@@ -18,15 +15,20 @@ def test_read_data(csv_files):
     """Test reading different temporal resolutions"""
     print("\nTesting data reading...")
     
-    # Test annual mean
-    data, coords = read_woa_csv(csv_files, "an", "00")
-    assert isinstance(data, np.ndarray), "Data should be numpy array"
-    assert data.ndim == 4, "Data should be 4-dimensional"
-    print(f"Annual data shape: {data.shape}")
-    
-    # Test seasonal data
-    data, coords = read_woa_csv(csv_files, "an", "13-16")
-    print(f"Seasonal data shape: {data.shape}")
+    # The annual and seasonal reads use different files, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        annual = pool.submit(read_woa_csv, csv_files, "an", "00")
+        seasonal = pool.submit(read_woa_csv, csv_files, "an", "13-16")
+
+        # Test annual mean
+        data, coords = annual.result()
+        assert isinstance(data, np.ndarray), "Data should be numpy array"
+        assert data.ndim == 4, "Data should be 4-dimensional"
+        print(f"Annual data shape: {data.shape}")
+
+        # Test seasonal data
+        data, coords = seasonal.result()
+        print(f"Seasonal data shape: {data.shape}")
 
 
 if __name__ == "__main__":
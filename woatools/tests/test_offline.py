@@ -0,0 +1,80 @@
+import os
+
+import numpy as np
+
+from woatools import (read_woa_csv, init_database, record_extracted_files,
+                      get_extracted_files)
+
+HEADER = ("#COMMA SEPARATED LATITUDE, LONGITUDE, AND VALUES AT DEPTHS (M):\n"
+          "#LATITUDE,LONGITUDE,AND VALUES AT DEPTHS (M):0,5,10\n")
+
+
+def write_csv(directory, name, rows):
+    """Write a small WOA-style CSV (3 depth levels) and return its path"""
+    path = os.path.join(directory, name)
+    with open(path, "w") as f:
+        f.write(HEADER + "".join(row + "\n" for row in rows))
+    return path
+
+
+def test_read_ragged_rows(tmp_path):
+    """Short rows are padded with NaN, over-long rows are truncated"""
+    rows = [
+        "-1.5,2.5,1.0,2.0,3.0,",    # full column with a trailing comma, first row
+        "-1.5,3.5,4.0",             # stops at the sea floor
+        "0.5,2.5,5.0,6.0,7.0,8.0",  # one field too many
+        "0.5,3.5,,9.0",             # missing value
+        "x,3.5,1.0",                # unparseable lat/lon, skipped
+    ]
+    csv_files = [write_csv(tmp_path, "woa23_decav_t00an01.csv", rows)]
+    data, coords = read_woa_csv(csv_files, "an", "00", quiet=True)
+
+    assert data.dtype == np.float32
+    assert data.shape == (2, 2, 3, 1)
+    np.testing.assert_array_equal(coords["lat"], [-1.5, 0.5])
+    np.testing.assert_array_equal(coords["lon"], [2.5, 3.5])
+    np.testing.assert_array_equal(coords["depth"], [0.0, 5.0, 10.0])
+    expected = np.array([[[1.0, 2.0, 3.0], [4.0, np.nan, np.nan]],
+                         [[5.0, 6.0, 7.0], [np.nan, 9.0, np.nan]]])
+    np.testing.assert_array_equal(data[..., 0], expected)
+
+
+def test_read_grid_union(tmp_path):
+    """Points missing from the first file are added to the lat/lon grid"""
+    # The 13 and 15 files have no full-depth row at all
+    rows = {
+        13: ["-1.5,2.5,13.0"],
+        14: ["-1.5,2.5,14.0", "0.5,3.5,14.5,14.25,14.125,99.0"],  # later row too long
+        15: ["0.5,2.5,15.0"],
+        16: ["-1.5,3.5,16.0,16.5,16.75"],
+    }
+    csv_files = [write_csv(tmp_path, f"woa23_decav_t{t}an01.csv", r)
+                 for t, r in rows.items()]
+    data, coords = read_woa_csv(csv_files, "an", "13-16", quiet=True)
+
+    assert data.shape == (2, 2, 3, 4)
+    np.testing.assert_array_equal(coords["lat"], [-1.5, 0.5])
+    np.testing.assert_array_equal(coords["lon"], [2.5, 3.5])
+    np.testing.assert_array_equal(coords["time"], [1, 2, 3, 4])
+    expected = np.full((2, 2, 3, 4), np.nan)
+    expected[0, 0, 0, 0] = 13.0
+    expected[0, 0, 0, 1] = 14.0
+    expected[1, 1, :, 1] = [14.5, 14.25, 14.125]
+    expected[1, 0, 0, 2] = 15.0
+    expected[0, 1, :, 3] = [16.0, 16.5, 16.75]
+    np.testing.assert_array_equal(data, expected)
+
+
+def test_extracted_files_round_trip(tmp_path):
+    """Recorded CSV lists are returned in order and replaced on re-record"""
+    download_dir = str(tmp_path)
+    init_database(download_dir)
+    assert get_extracted_files(download_dir, "a.tar.gz") == []
+
+    csv_files = [os.path.join(download_dir, name) for name in ("y.csv", "x.csv")]
+    record_extracted_files(download_dir, "a.tar.gz", csv_files)
+    assert get_extracted_files(download_dir, "a.tar.gz") == csv_files
+
+    record_extracted_files(download_dir, "a.tar.gz", csv_files[1:])
+    assert get_extracted_files(download_dir, "a.tar.gz") == csv_files[1:]
+    assert get_extracted_files(download_dir, "b.tar.gz") == []